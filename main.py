@@ -2,35 +2,62 @@ from fastapi import FastAPI, Request, Form
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
-from tools.github import GitHubRepoFetcher
-from tools.map_generator import generate_random_rooms ,initial_position
+from tools.github import GitHubRepoFetcher, Repository
+from tools.map_generator import cached_random_rooms ,initial_position
 
+from collections import OrderedDict
+from typing import List, Tuple
+import base64
+import logging
+import os
 import uvicorn
 
 app = FastAPI()
-templates = Jinja2Templates(directory="templates")
+
+# Compiled templates are cached on disk so restarts skip the compile step
+JINJA_CACHE_DIR = ".jinja_cache"
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+env = Environment(
+    loader=FileSystemLoader("templates"),
+    bytecode_cache=FileSystemBytecodeCache(directory=JINJA_CACHE_DIR),
+    auto_reload=False,
+    autoescape=True,
+)
+templates = Jinja2Templates(env=env)
  
 Folder= "/data"
 
+MIN_MAP_SIZE = 32
+
+# Rendered map pages, least recently used first. A page embeds every README
+# (around 400 KB for a user with ~160 repositories), so this bounds memory at ~13 MB
+MAP_CACHE_SIZE = 32
+rendered_maps: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
-@app.post("/map", response_class=HTMLResponse)
-async def map_view(request: Request, username: str = Form(...)):
-    fetcher = GitHubRepoFetcher(username)
-    data = fetcher.fetch_repos()
-    print(data)
-    print(username)
+def _map_key(username: str, data: List[Repository]) -> Tuple[str, int]:
+    """Cache key for a user's rendered map"""
+    return (username, len(data))
 
+def _render_map(username: str, data: List[Repository], force_refresh: bool = False) -> str:
+    """Load or generate the user's map and render the map page"""
     repos_amount = len(data)
-    mid = repos_amount//2
+    # Small accounts still get a map big enough to hold at least one room
+    mid = max(MIN_MAP_SIZE, repos_amount//2)
+    rooms_n = max(1, repos_amount)
 
     
-    generate_map = generate_random_rooms(mid, mid,repos_amount)
+    generate_map = cached_random_rooms(f"data/{username}_map.npz", mid, mid, rooms_n,
+                                       force_refresh=force_refresh)
     x,y = initial_position(generate_map)
-    print(x,y)
+    # One byte per cell, decoded by the page instead of a nested JSON list
+    map_b64 = base64.b64encode(generate_map.tobytes()).decode("ascii")
+    map_h, map_w = generate_map.shape
     # Convert Repository objects to dictionaries for JSON serialization
     repos_data = [
         {
@@ -42,17 +69,33 @@ async def map_view(request: Request, username: str = Form(...)):
         for repo in data
     ]
     
-    return templates.TemplateResponse("map.html", {
-        "request": request,
+    return templates.get_template("map.html").render({
         "username": username,
         "repos_data": repos_data,
-        "map":generate_map,
+        "map_b64":map_b64,
+        "map_w":map_w,
+        "map_h":map_h,
         "x":x,
         "y":y,
-        "map_size":mid,
 
     })
 
+@app.post("/map", response_class=HTMLResponse)
+async def map_view(request: Request, username: str = Form(...), force_refresh: bool = False):
+    with GitHubRepoFetcher(username) as fetcher:
+        data = await fetcher.afetch_repos(force_refresh=force_refresh)
+
+    # Reuse the rendered page so repeat visits skip map generation and rendering
+    key = _map_key(username, data)
+    if force_refresh or key not in rendered_maps:
+        rendered_maps[key] = _render_map(username, data, force_refresh)
+        if len(rendered_maps) > MAP_CACHE_SIZE:
+            rendered_maps.popitem(last=False)
+    rendered_maps.move_to_end(key)
+
+    return HTMLResponse(rendered_maps[key])
+
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     uvicorn.run(app, host="0.0.0.0", port=9600)
\ No newline at end of file
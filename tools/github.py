@@ -1,14 +1,85 @@
 import requests
+import aiohttp
+import asyncio
 import subprocess
 import json
+import logging
+import orjson
 import base64
 import os
-from typing import List, Optional
+import re
+import time
+import zstandard as zstd
+from typing import List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from functools import partial
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+def _last_page(link_header: str) -> int:
+    """Read the last page number from a GitHub pagination Link header"""
+    match = re.search(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"', link_header)
+    return int(match.group(1)) if match else 1
+
+# Longest rate-limit pause worth waiting out inside a single request
+MAX_RATE_LIMIT_WAIT = 60
+
+def _rate_limit_wait(status: int, headers) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, or None if it was not rate-limited"""
+    if status not in (403, 429):
+        return None
+    if 'Retry-After' in headers:
+        return float(headers['Retry-After'])
+    if headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+        return max(0.0, int(headers['X-RateLimit-Reset']) - time.time())
+    return None
+
+# Repositories per page of the REST repository list, the API maximum
+REPOS_PER_PAGE = 100
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repository metadata and README text for up to 100 repositories per request
+REPOS_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        name
+        url
+        description
+        readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+        readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+      }
+    }
+  }
+}
+"""
+
+def _repositories_connection(payload: dict) -> dict:
+    """Extract the repositories connection from a REPOS_QUERY response"""
+    if payload.get('errors'):
+        raise Exception(f"GraphQL query failed: {payload['errors'][0]['message']}")
+    owner = payload['data']['repositoryOwner']
+    if owner is None:
+        raise Exception("GitHub user not found")
+    return owner['repositories']
+
+def _add_graphql_page(payload: dict, repos: list) -> Optional[str]:
+    """Append the repositories of a REPOS_QUERY response to repos, returning the next page cursor or None"""
+    connection = _repositories_connection(payload)
+    repos.extend(Repository.from_graphql_node(node) for node in connection['nodes'])
+    return connection['pageInfo']['endCursor'] if connection['pageInfo']['hasNextPage'] else None
+
+# READMEs are plain Markdown and compress several times over in the cache
+_zstd_compressor = zstd.ZstdCompressor(level=3)
+_zstd_decompressor = zstd.ZstdDecompressor()
+
+@dataclass(slots=True)
 class Repository:
     """Data class to store repository information"""
     title: str
@@ -20,13 +91,43 @@ class Repository:
         return f"Repository(title='{self.title}', url='{self.url}', readme_length={len(self.readme) if self.readme else 0})"
     
     def to_dict(self):
-        """Convert Repository to dictionary"""
-        return asdict(self)
+        """Convert Repository to dictionary, storing the README as base64 zstd"""
+        data = asdict(self)
+        readme = data.pop('readme')
+        if readme:
+            data['readme_zst'] = base64.b64encode(_zstd_compressor.compress(readme.encode('utf-8'))).decode('ascii')
+        else:
+            data['readme'] = readme
+        return data
     
     @classmethod
     def from_dict(cls, data: dict):
-        """Create Repository from dictionary"""
+        """Create Repository from dictionary, accepting plain or compressed READMEs"""
+        data = dict(data)
+        if 'readme_zst' in data:
+            data['readme'] = _zstd_decompressor.decompress(base64.b64decode(data.pop('readme_zst'))).decode('utf-8')
         return cls(**data)
+    
+    @classmethod
+    def from_graphql_node(cls, node: dict):
+        """Create Repository from a REPOS_QUERY repository node"""
+        readme = node['readme'] or node['readmeLower']
+        return cls(
+            title=node['name'],
+            url=node['url'],
+            description=node['description'],
+            readme=readme['text'] if readme else None
+        )
+    
+    @classmethod
+    def from_rest(cls, repo_data: dict, readme: Optional[str]):
+        """Create Repository from a REST repository list entry and its README"""
+        return cls(
+            title=repo_data['name'],
+            url=repo_data['html_url'],
+            description=repo_data['description'],
+            readme=readme
+        )
 
 class GitHubRepoFetcher:
     """
@@ -34,12 +135,43 @@ class GitHubRepoFetcher:
     Supports caching to file and parallel README fetching.
     """
     
-    def __init__(self, username: str, cache_file: Optional[str] = None, max_workers: int = 10):
+    def __init__(self, username: str, cache_file: Optional[str] = None, max_workers: int = 10,
+                 max_retries: int = 3):
         self.username = username
         self.api_url = f"https://api.github.com/users/{username}/repos"
+        self.raw_url = f"https://raw.githubusercontent.com/{username}"
+        self.readme_api_url = f"https://api.github.com/repos/{username}"
         self.cache_file = cache_file or f"data/{username}_repos.json"
         self.max_workers = max_workers
-        self.print_lock = Lock()
+        self.max_retries = max_retries
+        
+        # Authenticated requests get 5000 requests/hour instead of 60
+        self.headers = {'Accept': 'application/vnd.github+json'}
+        # ETag of each repository list page, saved with the cache
+        self.etags = []
+        
+        self.token = os.environ.get('GITHUB_TOKEN')
+        if self.token:
+            self.headers['Authorization'] = f'Bearer {self.token}'
+        
+        # Pooled keep-alive connections, so README fetches reuse TLS sessions
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503])
+        ))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self.session.close()
     
     def fetch_repos(self, force_refresh: bool = False) -> List[Repository]:
         """
@@ -47,160 +179,387 @@ class GitHubRepoFetcher:
         Checks cache first unless force_refresh is True.
         Returns a list of Repository objects.
         """
-        # Check if cache exists and we're not forcing refresh
-        if not force_refresh and os.path.exists(self.cache_file):
-            print(f"Loading repositories from cache: {self.cache_file}")
-            return self._load_from_cache()
+        repos = self._cached_repos(force_refresh)
+        if repos is None:
+            # A refresh costs one 304 per page when nothing changed, whichever method fetched the cache
+            repos = self._revalidate_cache()
+        if repos is not None:
+            return repos
         
-        # Fetch fresh data
-        print(f"Fetching repositories for {self.username}...")
-        try:
-            repos = self._fetch_with_requests()
-        except Exception as e:
-            print(f"Failed to fetch with requests: {e}")
-            print("Attempting to use gh CLI...")
-            repos = self._fetch_with_gh_cli()
+        logger.info(f"Fetching repositories for {self.username}...")
+        for method, fetch in self._fetch_methods(self._fetch_with_graphql, self._fetch_with_requests,
+                                                 self._fetch_with_gh_cli):
+            try:
+                repos = fetch()
+                break
+            except Exception as e:
+                error = e
+                logger.warning(f"Failed to fetch with {method}: {e}")
+        else:
+            raise error
         
-        # Save to cache
         self._save_to_cache(repos)
+        return repos
+    
+    async def afetch_repos(self, force_refresh: bool = False) -> List[Repository]:
+        """
+        Async version of fetch_repos.
+        Fetches pages and READMEs concurrently on a single aiohttp session.
+        """
+        repos = self._cached_repos(force_refresh)
+        if repos is None:
+            # A refresh costs one 304 per page when nothing changed, whichever method fetched the cache
+            repos = await self._arevalidate_cache()
+        if repos is not None:
+            return repos
         
+        logger.info(f"Fetching repositories for {self.username}...")
+        for method, fetch in self._fetch_methods(self._afetch_with_graphql, self._fetch_with_aiohttp,
+                                                 partial(asyncio.to_thread, self._fetch_with_gh_cli)):
+            try:
+                repos = await fetch()
+                break
+            except Exception as e:
+                error = e
+                logger.warning(f"Failed to fetch with {method}: {e}")
+        else:
+            raise error
+        
+        self._save_to_cache(repos)
         return repos
     
-    def _load_from_cache(self) -> List[Repository]:
-        """Load repositories from cache file"""
+    def _cached_repos(self, force_refresh: bool) -> Optional[List[Repository]]:
+        """The cached repositories, or None if there is no cache or a refresh is forced"""
+        if force_refresh or not os.path.exists(self.cache_file):
+            return None
+        logger.info(f"Loading repositories from cache: {self.cache_file}")
+        return self._load_from_cache()
+    
+    def _fetch_methods(self, graphql, rest, gh_cli) -> list:
+        """Fetch methods in the order they are tried, each one only if the previous ones failed"""
+        # The GraphQL API only accepts authenticated requests
+        methods = [('GraphQL', graphql)] if self.token else []
+        return methods + [('REST API', rest), ('gh CLI', gh_cli)]
+    
+    def _read_cache_payload(self):
+        """Parse the cache file without building any Repository"""
+        with open(self.cache_file, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def _load_from_cache(self, payload=None) -> List[Repository]:
+        """Load repositories from cache file, or from its already parsed payload"""
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [Repository.from_dict(repo) for repo in data]
+            if payload is None:
+                payload = self._read_cache_payload()
+            # Caches written before ETags were stored hold a bare list
+            repos = payload if isinstance(payload, list) else payload['repos']
+            return [Repository.from_dict(repo) for repo in repos]
         except Exception as e:
             raise Exception(f"Failed to load from cache: {e}")
     
+    def _cached_etags(self) -> Tuple[Optional[dict], List[str]]:
+        """
+        The parsed cache and the ETags of its repository list pages, in page order.
+        No README is decoded, so this stays cheap for large caches.
+        """
+        if not os.path.exists(self.cache_file):
+            return None, []
+        try:
+            payload = self._read_cache_payload()
+        except Exception:
+            return None, []
+        # Older caches hold a bare list, or one ETag that only covered the first page
+        etags = payload.get('etags') if isinstance(payload, dict) else None
+        if not etags or not all(etags):
+            return payload, []
+        return payload, etags
+    
     def _save_to_cache(self, repos: List[Repository]):
-        """Save repositories to cache file"""
+        """Save repositories and the repository list page ETags to cache file"""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump([repo.to_dict() for repo in repos], f, indent=2, ensure_ascii=False)
-            print(f"Saved {len(repos)} repositories to {self.cache_file}")
+            with open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps({'etags': self.etags, 'repos': [repo.to_dict() for repo in repos]}))
+            logger.info(f"Saved {len(repos)} repositories to {self.cache_file}")
         except Exception as e:
-            print(f"Failed to save to cache: {e}")
+            logger.warning(f"Failed to save to cache: {e}")
     
-    def _safe_print(self, message: str):
-        """Thread-safe printing"""
-        with self.print_lock:
-            print(message)
+    def _readme_urls(self, repo_name: str, branch: Optional[str]) -> List[str]:
+        """
+        README URLs to try in order. README.md is read from the raw CDN when the
+        branch is known; other README names and casings fall back to the API readme endpoint.
+        """
+        urls = [f"{self.raw_url}/{repo_name}/{branch}/README.md"] if branch else []
+        return urls + [f"{self.readme_api_url}/{repo_name}/readme"]
+    
+    def _readme_text(self, url: str, body: str) -> str:
+        """README text from a raw CDN file body or an API readme endpoint JSON body"""
+        if url.startswith(self.raw_url):
+            return body
+        return base64.b64decode(orjson.loads(body)['content']).decode('utf-8')
+    
+    def _graphql_body(self, cursor: Optional[str]) -> dict:
+        """JSON body of the REPOS_QUERY request for the page after cursor"""
+        return {'query': REPOS_QUERY, 'variables': {'login': self.username, 'cursor': cursor}}
     
-    def _fetch_readme(self, repo_name: str) -> Optional[str]:
+    def _page_params(self, page: int) -> dict:
+        """Query parameters for one page of the repository list"""
+        # Most recently pushed first, so any push changes the first page's ETag
+        return {'page': page, 'per_page': REPOS_PER_PAGE, 'sort': 'pushed'}
+    
+    def _not_modified(self, payload: dict) -> List[Repository]:
+        """Keep the cached repositories after every repository list page came back 304 Not Modified"""
+        logger.info("Repository list not modified, using cache")
+        self.etags = payload['etags']
+        return self._load_from_cache(payload)
+    
+    def _fetch_readme(self, repo_name: str, branch: Optional[str] = None) -> Optional[str]:
         """Fetch README content for a repository using requests"""
-        readme_url = f"https://api.github.com/repos/{self.username}/{repo_name}/readme"
+        try:
+            for url in self._readme_urls(repo_name, branch):
+                response = self.session.get(url, timeout=10)
+                if response.status_code == 200:
+                    return self._readme_text(url, response.text)
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to fetch README for {repo_name}: {e}")
+            return None
+    
+    def _fetch_list_page(self, page: int, headers: Optional[dict] = None) -> requests.Response:
+        """Fetch one page of the repository list using requests"""
+        response = self.session.get(self.api_url, params=self._page_params(page), headers=headers, timeout=10)
+        response.raise_for_status()
+        return response
+    
+    def _fetch_repo_list(self, executor: ThreadPoolExecutor) -> Tuple[List[str], list]:
+        """Fetch every repository list page, returning their ETags and repository entries in page order"""
+        # The first page tells us how many pages there are
+        first_page = self._fetch_list_page(1)
+        page_etags = [first_page.headers.get('ETag')]
+        all_repos_data = first_page.json()
+        last_page = _last_page(first_page.headers.get('Link', ''))
         
+        # Fetch the remaining pages in parallel, preserving page order
+        for response in executor.map(self._fetch_list_page, range(2, last_page + 1)):
+            page_etags.append(response.headers.get('ETag'))
+            all_repos_data.extend(response.json())
+        return page_etags, all_repos_data
+    
+    def _revalidate_cache(self) -> Optional[List[Repository]]:
+        """The cached repositories if every cached repository list page comes back 304 Not Modified"""
+        cached, etags = self._cached_etags()
+        if not etags:
+            return None
         try:
-            response = requests.get(readme_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                content = base64.b64decode(data['content']).decode('utf-8')
-                return content
-            else:
-                return None
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                responses = list(executor.map(
+                    self._fetch_list_page, range(1, len(etags) + 1), [{'If-None-Match': etag} for etag in etags]
+                ))
         except Exception as e:
-            self._safe_print(f"Failed to fetch README for {repo_name}: {e}")
+            logger.warning(f"Failed to revalidate the cache: {e}")
             return None
+        if all(response.status_code == 304 for response in responses):
+            return self._not_modified(cached)
+        return None
     
-    def _fetch_repo_with_readme(self, repo_data: dict) -> Repository:
-        """Fetch a single repository with its README"""
-        repo_name = repo_data['name']
-        self._safe_print(f"Fetching README for {repo_name}...")
+    def _fetch_with_graphql(self) -> List[Repository]:
+        """Fetch repositories and their READMEs with one GraphQL request per 100 repositories"""
+        repos = []
+        cursor = None
         
-        readme = self._fetch_readme(repo_name)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # GraphQL has no conditional requests, so record the REST list page ETags
+            # before querying; the next refresh can then revalidate against them
+            try:
+                page_etags, _ = self._fetch_repo_list(executor)
+            except Exception as e:
+                logger.warning(f"Failed to read repository list ETags: {e}")
+                page_etags = []
+            
+            logger.info("Fetching repositories with GraphQL...")
+            while True:
+                response = self.session.post(GRAPHQL_URL, json=self._graphql_body(cursor), timeout=30)
+                response.raise_for_status()
+                cursor = _add_graphql_page(response.json(), repos)
+                if cursor is None:
+                    break
+            
+            # The query only reads README.md and readme.md; the REST readme endpoint resolves any other name
+            missing = [repo for repo in repos if repo.readme is None]
+            for repo, readme in zip(missing, executor.map(self._fetch_readme, [repo.title for repo in missing])):
+                repo.readme = readme
         
-        return Repository(
-            title=repo_name,
-            url=repo_data['html_url'],
-            description=repo_data['description'],
-            readme=readme
-        )
+        self.etags = page_etags
+        return repos
     
     def _fetch_with_requests(self) -> List[Repository]:
-        """Fetch repositories using requests library with parallel README fetching"""
-        # First, get all repository metadata
-        all_repos_data = []
-        page = 1
-        per_page = 100
-        
-        print("Fetching repository list...")
-        while True:
-            response = requests.get(
-                self.api_url,
-                params={'page': page, 'per_page': per_page},
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+        """Fetch repositories using requests library with parallel pagination and README fetching"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            logger.info("Fetching repository list...")
+            # Kept aside until every page succeeds, so a failed fetch never saves a partial list
+            page_etags, all_repos_data = self._fetch_repo_list(executor)
             
-            if not data:
-                break
+            logger.info(f"Found {len(all_repos_data)} repositories. Fetching READMEs in parallel...")
+            readmes = executor.map(
+                lambda repo_data: self._fetch_readme(repo_data['name'], repo_data.get('default_branch')),
+                all_repos_data
+            )
+            repos = [Repository.from_rest(repo_data, readme) for repo_data, readme in zip(all_repos_data, readmes)]
+        
+        self.etags = page_etags
+        return repos
+    
+    async def _get(self, session: aiohttp.ClientSession, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """GET through the shared session, waiting out GitHub rate limits"""
+        return await self._request(session, 'GET', url, **kwargs)
+    
+    async def _request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Send a request, waiting out GitHub rate limits.
+        The body is read before returning so the response can be used after release.
+        """
+        for attempt in range(self.max_retries + 1):
+            async with session.request(method, url, **kwargs) as response:
+                await response.read()
             
-            all_repos_data.extend(data)
-            page += 1
+            wait = _rate_limit_wait(response.status, response.headers)
+            if wait is None or wait > MAX_RATE_LIMIT_WAIT or attempt == self.max_retries:
+                return response
             
-            if len(data) < per_page:
-                break
-        
-        print(f"Found {len(all_repos_data)} repositories. Fetching READMEs in parallel...")
+            logger.warning(f"Rate limited on {url}, retrying in {wait:.0f}s...")
+            await asyncio.sleep(wait)
+    
+    async def _afetch_readme(self, session: aiohttp.ClientSession, repo_name: str,
+                             branch: Optional[str] = None) -> Optional[str]:
+        """Fetch README content for a repository using aiohttp"""
+        logger.debug(f"Fetching README for {repo_name}...")
+        try:
+            for url in self._readme_urls(repo_name, branch):
+                response = await self._get(session, url)
+                if response.status == 200:
+                    return self._readme_text(url, await response.text())
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to fetch README for {repo_name}: {e}")
+            return None
+    
+    async def _afetch_page(self, session: aiohttp.ClientSession, page: int,
+                           headers: Optional[dict] = None) -> aiohttp.ClientResponse:
+        """Fetch one page of the repository list"""
+        response = await self._get(session, self.api_url, params=self._page_params(page), headers=headers)
+        response.raise_for_status()
+        return response
+    
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session shared by all requests of one fetch"""
+        # The connector limit is the only cap on concurrent requests
+        connector = aiohttp.TCPConnector(limit=self.max_workers)
+        # Per-socket timeouts: requests queued behind the connector limit must not time out
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers)
+    
+    async def _afetch_repo_list(self, session: aiohttp.ClientSession) -> Tuple[List[str], list]:
+        """Fetch every repository list page, returning their ETags and repository entries in page order"""
+        # The first page tells us how many pages there are
+        first_page = await self._afetch_page(session, 1)
+        page_etags = [first_page.headers.get('ETag')]
+        all_repos_data = await first_page.json()
         
-        # Fetch READMEs in parallel
+        pages = await asyncio.gather(*[
+            self._afetch_page(session, page)
+            for page in range(2, _last_page(first_page.headers.get('Link', '')) + 1)
+        ])
+        for response in pages:
+            page_etags.append(response.headers.get('ETag'))
+            all_repos_data.extend(await response.json())
+        return page_etags, all_repos_data
+    
+    async def _arevalidate_cache(self) -> Optional[List[Repository]]:
+        """Async version of _revalidate_cache"""
+        cached, etags = self._cached_etags()
+        if not etags:
+            return None
+        try:
+            async with self._client_session() as session:
+                responses = await asyncio.gather(*[
+                    self._afetch_page(session, page, {'If-None-Match': etag})
+                    for page, etag in enumerate(etags, 1)
+                ])
+        except Exception as e:
+            logger.warning(f"Failed to revalidate the cache: {e}")
+            return None
+        if all(response.status == 304 for response in responses):
+            return self._not_modified(cached)
+        return None
+    
+    async def _afetch_with_graphql(self) -> List[Repository]:
+        """Fetch repositories and their READMEs with one GraphQL request per 100 repositories"""
         repos = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_repo = {
-                executor.submit(self._fetch_repo_with_readme, repo_data): repo_data
-                for repo_data in all_repos_data
-            }
+        cursor = None
+        
+        async with self._client_session() as session:
+            # GraphQL has no conditional requests, so record the REST list page ETags
+            # before querying; the next refresh can then revalidate against them
+            try:
+                page_etags, _ = await self._afetch_repo_list(session)
+            except Exception as e:
+                logger.warning(f"Failed to read repository list ETags: {e}")
+                page_etags = []
+            
+            logger.info("Fetching repositories with GraphQL...")
+            while True:
+                response = await self._request(session, 'POST', GRAPHQL_URL, json=self._graphql_body(cursor))
+                response.raise_for_status()
+                cursor = _add_graphql_page(await response.json(), repos)
+                if cursor is None:
+                    break
             
-            for future in as_completed(future_to_repo):
-                try:
-                    repo = future.result()
-                    repos.append(repo)
-                except Exception as e:
-                    repo_data = future_to_repo[future]
-                    self._safe_print(f"Error processing {repo_data['name']}: {e}")
+            # The query only reads README.md and readme.md; the REST readme endpoint resolves any other name
+            missing = [repo for repo in repos if repo.readme is None]
+            readmes = await asyncio.gather(*[self._afetch_readme(session, repo.title) for repo in missing])
+            for repo, readme in zip(missing, readmes):
+                repo.readme = readme
         
+        self.etags = page_etags
         return repos
     
+    async def _fetch_with_aiohttp(self) -> List[Repository]:
+        """Fetch repositories using aiohttp with concurrent pagination and README fetching"""
+        async with self._client_session() as session:
+            logger.info("Fetching repository list...")
+            # Kept aside until every page succeeds, so a failed fetch never saves a partial list
+            page_etags, all_repos_data = await self._afetch_repo_list(session)
+            
+            logger.info(f"Found {len(all_repos_data)} repositories. Fetching READMEs concurrently...")
+            readmes = await asyncio.gather(*[
+                self._afetch_readme(session, repo_data['name'], repo_data.get('default_branch'))
+                for repo_data in all_repos_data
+            ])
+        
+        self.etags = page_etags
+        return [Repository.from_rest(repo_data, readme) for repo_data, readme in zip(all_repos_data, readmes)]
+    
     def _fetch_readme_with_gh_cli(self, repo_name: str) -> Optional[str]:
         """Fetch README content using gh CLI"""
-        # Try different README filename variations
-        readme_variations = [
-            'README.md', 'readme.md', 'Readme.md',
-            'README.MD', 'readme.MD', 'Readme.MD',
-            'README', 'readme', 'Readme',
-            'README.txt', 'readme.txt', 'Readme.txt',
-            'README.rst', 'readme.rst', 'Readme.rst'
-        ]
-        
-        for readme_name in readme_variations:
-            try:
-                result = subprocess.run(
-                    ['gh', 'api', f'/repos/{self.username}/{repo_name}/contents/{readme_name}'],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                data = json.loads(result.stdout)
-                if 'content' in data:
-                    content = base64.b64decode(data['content']).decode('utf-8')
-                    return content
-            except subprocess.CalledProcessError:
-                continue
-            except Exception as e:
-                self._safe_print(f"Error decoding README for {repo_name}: {e}")
-                continue
-        
-        return None
+        # The readme endpoint resolves any README filename and casing in one call
+        try:
+            result = subprocess.run(
+                ['gh', 'api', f'/repos/{self.username}/{repo_name}/readme'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            data = json.loads(result.stdout)
+            return base64.b64decode(data['content']).decode('utf-8')
+        except subprocess.CalledProcessError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error decoding README for {repo_name}: {e}")
+            return None
     
     def _fetch_repo_with_readme_gh_cli(self, repo_data: dict) -> Repository:
         """Fetch a single repository with its README using gh CLI"""
         repo_name = repo_data['name']
-        self._safe_print(f"Fetching README for {repo_name}...")
+        logger.debug(f"Fetching README for {repo_name}...")
         
         readme = self._fetch_readme_with_gh_cli(repo_name)
         
@@ -220,7 +579,7 @@ class GitHubRepoFetcher:
                          check=True)
             
             # Fetch repos using gh CLI
-            print("Fetching repository list...")
+            logger.info("Fetching repository list...")
             result = subprocess.run(
                 ['gh', 'repo', 'list', self.username, '--json', 
                  'name,url,description', '--limit', '1000'],
@@ -230,7 +589,7 @@ class GitHubRepoFetcher:
             )
             
             all_repos_data = json.loads(result.stdout)
-            print(f"Found {len(all_repos_data)} repositories. Fetching READMEs in parallel...")
+            logger.info(f"Found {len(all_repos_data)} repositories. Fetching READMEs in parallel...")
             
             # Fetch READMEs in parallel
             repos = []
@@ -246,7 +605,7 @@ class GitHubRepoFetcher:
                         repos.append(repo)
                     except Exception as e:
                         repo_data = future_to_repo[future]
-                        self._safe_print(f"Error processing {repo_data['name']}: {e}")
+                        logger.warning(f"Error processing {repo_data['name']}: {e}")
             
             return repos
             
@@ -1,47 +1,36 @@
-import random
-from typing import List, Tuple
+import os
+from typing import Optional
+import numpy as np
+from numba import njit
+from scipy.sparse.csgraph import minimum_spanning_tree
 
-class Room:
-    def __init__(self, x: int, y: int, width: int, height: int):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.center = (x + width // 2, y + height // 2)
+# Shared generator for every draw made outside the jitted helpers
+_rng = np.random.default_rng()
 
-def rooms_overlap(room1: Room, room2: Room, padding: int = 2) -> bool:
-    """Check if two rooms overlap with optional padding"""
-    return (room1.x - padding < room2.x + room2.width + padding and
-            room1.x + room1.width + padding > room2.x - padding and
-            room1.y - padding < room2.y + room2.height + padding and
-            room1.y + room1.height + padding > room2.y - padding)
-
-def generate_random_rooms(width: int = 154, height: int = 154, rooms_n: int = 20) -> List[List[int]]:
-    """Generate a map with randomly placed non-overlapping rooms"""
-    # Validate minimum dimensions
-    min_dimension = 10  # Minimum size needed for rooms
-    if width < min_dimension or height < min_dimension:
-        raise ValueError(f"Map dimensions must be at least {min_dimension}x{min_dimension}")
-    
-    map_grid = [[1 for _ in range(width)] for _ in range(height)]
+@njit(cache=True)
+def _place_rooms(width: int, height: int, rooms_n: int, max_attempts: int, reach: int, seed: int):
+    """
+    Randomly place up to rooms_n non-overlapping rooms.
+    Returns an (n, 4) int32 array of x, y, width, height and the occupancy mask of the rooms.
+    """
+    np.random.seed(seed)
+    rooms = np.empty((min(rooms_n, max_attempts), 4), dtype=np.int32)
+    # Occupancy mask of placed rooms
+    placed = np.zeros((height, width), dtype=np.bool_)
+    count = 0
     
-    rooms = []
-    max_attempts = 100
-    room_count = rooms_n
+    # Random room size with bounds checking
+    max_room_w = min(8, width - 4)  # Ensure room fits with padding
+    max_room_h = min(8, height - 4)
+    if max_room_w < 4 or max_room_h < 4:
+        return rooms[:0], placed  # Map too small for rooms
     
     for _ in range(max_attempts):
-        if len(rooms) >= room_count:
+        if count >= rooms_n:
             break
-            
-        # Random room size with bounds checking
-        max_room_w = min(8, width - 4)  # Ensure room fits with padding
-        max_room_h = min(8, height - 4)
         
-        if max_room_w < 4 or max_room_h < 4:
-            break  # Map too small for more rooms
-            
-        room_w = random.randint(4, max_room_w)
-        room_h = random.randint(4, max_room_h)
+        room_w = np.random.randint(4, max_room_w + 1)
+        room_h = np.random.randint(4, max_room_h + 1)
         
         # Calculate max position with bounds checking
         max_x = width - room_w - 2
@@ -50,129 +39,125 @@ def generate_random_rooms(width: int = 154, height: int = 154, rooms_n: int = 20
         # Skip if no valid position exists
         if max_x < 1 or max_y < 1:
             continue
-            
-        room_x = random.randint(1, max_x)
-        room_y = random.randint(1, max_y)
         
-        new_room = Room(room_x, room_y, room_w, room_h)
+        room_x = np.random.randint(1, max_x + 1)
+        room_y = np.random.randint(1, max_y + 1)
         
         # Check for overlaps
-        overlaps = False
-        for existing_room in rooms:
-            if rooms_overlap(new_room, existing_room):
-                overlaps = True
-                break
-                
-        if not overlaps:
-            rooms.append(new_room)
+        if placed[max(0, room_y - reach):room_y + room_h + reach,
+                  max(0, room_x - reach):room_x + room_w + reach].any():
+            continue
+        
+        placed[room_y:room_y + room_h, room_x:room_x + room_w] = True
+        rooms[count, 0] = room_x
+        rooms[count, 1] = room_y
+        rooms[count, 2] = room_w
+        rooms[count, 3] = room_h
+        count += 1
     
-    # Carve out rooms
-    for room in rooms:
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                if 0 <= y < height and 0 <= x < width:
-                    map_grid[y][x] = 0
+    return rooms[:count], placed
+
+@njit(cache=True)
+def _carve_corridors(map_grid: np.ndarray, centers: np.ndarray, pairs: np.ndarray):
+    """Carve an L-shaped corridor, horizontal then vertical, between the centers of each room pair"""
+    for k in range(pairs.shape[0]):
+        x1, y1 = centers[pairs[k, 0]]
+        x2, y2 = centers[pairs[k, 1]]
+        map_grid[y1, min(x1, x2):max(x1, x2) + 1] = 0
+        map_grid[min(y1, y2):max(y1, y2) + 1, x2] = 0
+
+@njit(cache=True)
+def _door_candidates(map_grid: np.ndarray, placed: np.ndarray) -> np.ndarray:
+    """
+    Mask of inner wall cells with floor on exactly one orthogonal side
+    and a room cell among their 8 neighbours.
+    """
+    height, width = map_grid.shape
+    doors = np.zeros((height, width), dtype=np.bool_)
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            if map_grid[y, x] != 1:
+                continue
+            floor_count = (int(map_grid[y - 1, x] == 0) + int(map_grid[y + 1, x] == 0)
+                           + int(map_grid[y, x - 1] == 0) + int(map_grid[y, x + 1] == 0))
+            if floor_count == 1 and placed[y - 1:y + 2, x - 1:x + 2].any():
+                doors[y, x] = True
+    return doors
+
+def generate_random_rooms(width: int = 154, height: int = 154, rooms_n: int = 20,
+                          seed: Optional[int] = None) -> np.ndarray:
+    """
+    Generate a map with randomly placed non-overlapping rooms, as a (height, width) uint8 array.
+    The same seed always gives the same map; without one the shared generator is used.
+    """
+    # Validate minimum dimensions
+    min_dimension = 10  # Minimum size needed for rooms
+    if width < min_dimension or height < min_dimension:
+        raise ValueError(f"Map dimensions must be at least {min_dimension}x{min_dimension}")
     
-    # Create minimum spanning tree to connect all rooms
-    connected = set()
-    unconnected = set(range(len(rooms)))
+    # Padding applies to both rooms, so a new room must keep
+    # 2 * padding cells away from any placed one
+    padding = 2
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    rooms, placed = _place_rooms(width, height, rooms_n, 100, 2 * padding, int(rng.integers(2**31)))
     
-    if rooms:
-        # Start with a random room
-        start_idx = random.choice(list(unconnected))
-        connected.add(start_idx)
-        unconnected.remove(start_idx)
-        
-        while unconnected:
-            # Find closest unconnected room to any connected room
-            closest_pair = None
-            min_distance = float('inf')
-            
-            for connected_idx in connected:
-                for unconnected_idx in unconnected:
-                    room1 = rooms[connected_idx]
-                    room2 = rooms[unconnected_idx]
-                    dist = abs(room1.center[0] - room2.center[0]) + abs(room1.center[1] - room2.center[1])
-                    
-                    if dist < min_distance:
-                        min_distance = dist
-                        closest_pair = (connected_idx, unconnected_idx)
-            
-            if closest_pair:
-                # Connect the rooms
-                room1 = rooms[closest_pair[0]]
-                room2 = rooms[closest_pair[1]]
-                
-                # Create corridor between centers
-                x1, y1 = room1.center
-                x2, y2 = room2.center
-                
-                # Horizontal then vertical with bounds checking
-                for x in range(min(x1, x2), max(x1, x2) + 1):
-                    if 0 <= x < width and 0 <= y1 < height:
-                        map_grid[y1][x] = 0
-                for y in range(min(y1, y2), max(y1, y2) + 1):
-                    if 0 <= x2 < width and 0 <= y < height:
-                        map_grid[y][x2] = 0
-                
-                connected.add(closest_pair[1])
-                unconnected.remove(closest_pair[1])
+    # Carve out rooms
+    map_grid = np.ones((height, width), dtype=np.uint8)
+    map_grid[placed] = 0
     
-    # Add some extra random connections for loops
+    centers = rooms[:, :2] + rooms[:, 2:] // 2
     if len(rooms) > 1:
-        for i in range(len(rooms) // 2):
-            room1, room2 = random.sample(rooms, 2)
-            if random.random() < 0.4:  # 40% chance for extra connection
-                x1, y1 = room1.center
-                x2, y2 = room2.center
-                
-                for x in range(min(x1, x2), max(x1, x2) + 1):
-                    if 0 <= x < width and 0 <= y1 < height:
-                        map_grid[y1][x] = 0
-                for y in range(min(y1, y2), max(y1, y2) + 1):
-                    if 0 <= x2 < width and 0 <= y < height:
-                        map_grid[y][x2] = 0
+        # Connect all rooms along a minimum spanning tree of center distances
+        distances = np.abs(centers[:, None, :] - centers[None, :, :]).sum(axis=-1)
+        pairs = np.column_stack(minimum_spanning_tree(distances).nonzero())
+        
+        # Add some extra random connections for loops, drawn in one batch
+        n = len(rooms)
+        first = rng.integers(n, size=n // 2)
+        second = (first + rng.integers(1, n, size=n // 2)) % n  # never the same room
+        extra = np.column_stack((first, second))[rng.random(n // 2) < 0.4]  # 40% chance for extra connection
+        
+        _carve_corridors(map_grid, centers, np.concatenate((pairs, extra)).astype(np.int64))
     
-    # Add doors
-    door_positions = []
-    for room in rooms:
-        # Check room perimeter for door positions
-        for y in range(room.y - 1, room.y + room.height + 1):
-            for x in range(room.x - 1, room.x + room.width + 1):
-                if (0 < x < width - 1 and 0 < y < height - 1 and 
-                    map_grid[y][x] == 1):
-                    # Check if wall has floor on exactly one side (door candidate)
-                    floor_count = 0
-                    for dx, dy in [(0,1), (0,-1), (1,0), (-1,0)]:
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < width and 0 <= ny < height and map_grid[ny][nx] == 0:
-                            floor_count += 1
-                    
-                    if floor_count == 1:
-                        door_positions.append((x, y))
+    # Add doors: walls next to a room with floor on exactly one side
+    door_candidates = np.argwhere(_door_candidates(map_grid, placed))
     
     # Place doors (cap at available positions)
-    door_count = min(rooms_n, len(door_positions))
-    if door_count > 0:
-        selected_doors = random.sample(door_positions, door_count)
-        for x, y in selected_doors:
-            map_grid[y][x] = 2
+    selected = rng.choice(len(door_candidates), size=min(rooms_n, len(door_candidates)), replace=False)
+    map_grid[door_candidates[selected, 0], door_candidates[selected, 1]] = 2
     
     # Place exit
-    if rooms:
-        exit_room = random.choice(rooms)
-        exit_x = exit_room.x + random.randint(1, max(1, exit_room.width - 1))
-        exit_y = exit_room.y + random.randint(1, max(1, exit_room.height - 1))
+    if len(rooms):
+        room_x, room_y, room_w, room_h = (int(v) for v in rooms[rng.integers(len(rooms))])
+        exit_x = room_x + int(rng.integers(1, max(1, room_w - 1), endpoint=True))
+        exit_y = room_y + int(rng.integers(1, max(1, room_h - 1), endpoint=True))
         if 0 <= exit_x < width and 0 <= exit_y < height:
-            map_grid[exit_y][exit_x] = 5
+            map_grid[exit_y, exit_x] = 5
+    
+    return map_grid
+
+def cached_random_rooms(cache_file: str, width: int, height: int, rooms_n: int,
+                        force_refresh: bool = False) -> np.ndarray:
+    """
+    Load a map saved by a previous call with the same parameters,
+    otherwise generate one with generate_random_rooms and save it.
+    """
+    if not force_refresh and os.path.exists(cache_file):
+        with np.load(cache_file) as cached:
+            if cached['grid'].shape == (height, width) and int(cached['rooms_n']) == rooms_n:
+                return cached['grid']
     
+    map_grid = generate_random_rooms(width, height, rooms_n)
+    np.savez_compressed(cache_file, grid=map_grid, rooms_n=rooms_n)
     return map_grid
 
 def initial_position(matrix):
-    for x in range(len(matrix)):
-        for y in range(len(matrix[0])):
-            if matrix[y][x] == 0:
-                return (x,y) 
+    """Return (x, y) of the first floor cell in row-major order, or None if there is none"""
+    arr = np.asarray(matrix)
+    floor = (arr == 0).reshape(-1)
+    i = int(floor.argmax())
+    if floor[i]:
+        return (i % arr.shape[1], i // arr.shape[1])
 
 
 # Example usage and visualization